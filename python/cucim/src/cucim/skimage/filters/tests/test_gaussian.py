@@ -30,6 +30,26 @@ def test_default_sigma():
     assert cp.all(gaussian(a) == gaussian(a, sigma=1))
 
 
+def test_batched_frames():
+    # a zero sigma on the stacking axis filters all frames in one call
+    rng = cp.random.default_rng(5)
+    frames = rng.standard_normal((4, 64, 64), dtype=cp.float32)
+    batched = gaussian(frames, sigma=(0, 2, 2), mode="reflect")
+    for frame, expected in zip(frames, batched):
+        cp.testing.assert_allclose(
+            gaussian(frame, sigma=2, mode="reflect"), expected, rtol=1e-6
+        )
+
+
+def test_inplace_output():
+    rng = cp.random.default_rng(3)
+    a = rng.standard_normal((32, 32), dtype=cp.float32)
+    expected = gaussian(a, sigma=1.5, mode="reflect")
+    result = gaussian(a, sigma=1.5, mode="reflect", output=a)
+    assert result is a
+    cp.testing.assert_allclose(result, expected, rtol=1e-6)
+
+
 def test_energy_decrease():
     a = cp.zeros((3, 3))
     a[1, 1] = 1.0